@@ -154,6 +154,34 @@ impl Dataset {
         }
     }
 
+    /// Initialize dataset from cache, splitting the items across `threads` threads
+    ///
+    /// RandomX allows disjoint item ranges to be initialized concurrently.
+    pub fn init_parallel(&mut self, cache: &Cache, threads: usize) {
+        let ranges = split_init_range(Self::item_count(), threads);
+        if ranges.len() <= 1 {
+            self.init(cache);
+            return;
+        }
+
+        // Raw pointers are not Send; each thread only touches its own range.
+        struct InitPtrs(*mut randomx_dataset, *mut randomx_cache);
+        unsafe impl Sync for InitPtrs {}
+        impl InitPtrs {
+            fn init(&self, start: u64, count: u64) {
+                unsafe { randomx_init_dataset(self.0, self.1, start as _, count as _) };
+            }
+        }
+
+        let ptrs = InitPtrs(self.ptr, cache.as_ptr());
+        std::thread::scope(|s| {
+            for (start, n) in ranges {
+                let ptrs = &ptrs;
+                s.spawn(move || ptrs.init(start, n));
+            }
+        });
+    }
+
     /// Get raw pointer (for internal use)
     pub(crate) fn as_ptr(&self) -> *mut randomx_dataset {
         self.ptr
@@ -165,6 +193,25 @@ impl Dataset {
     }
 }
 
+/// Split `0..count` into `(start, len)` ranges, one per thread
+///
+/// The thread count is clamped to `1..=count`; the first `count % threads`
+/// ranges get one extra item so the ranges cover `0..count` exactly.
+fn split_init_range(count: u64, threads: usize) -> Vec<(u64, u64)> {
+    let threads = (threads as u64).clamp(1, count.max(1));
+    let per_thread = count / threads;
+    let remainder = count % threads;
+
+    let mut ranges = Vec::with_capacity(threads as usize);
+    let mut start = 0u64;
+    for i in 0..threads {
+        let n = per_thread + u64::from(i < remainder);
+        ranges.push((start, n));
+        start += n;
+    }
+    ranges
+}
+
 impl Drop for Dataset {
     fn drop(&mut self) {
         if !self.ptr.is_null() {
@@ -218,6 +265,48 @@ impl Vm {
         }
         output
     }
+
+    /// Start a pipelined hash batch with the first input
+    ///
+    /// The returned batch borrows the VM mutably, so no other hash can be
+    /// interleaved while it is open. Its result is returned by the following
+    /// `HashBatch::hash_next` or `HashBatch::hash_last`.
+    pub fn hash_first(&mut self, input: &[u8]) -> HashBatch<'_> {
+        unsafe {
+            randomx_calculate_hash_first(self.ptr, input.as_ptr() as *const _, input.len());
+        }
+        HashBatch { vm: self }
+    }
+}
+
+/// Open pipelined hash batch on a VM, started by `Vm::hash_first`
+pub struct HashBatch<'a> {
+    vm: &'a mut Vm,
+}
+
+impl HashBatch<'_> {
+    /// Return the hash of the previous input and start hashing `next_input`
+    pub fn hash_next(&mut self, next_input: &[u8]) -> [u8; 32] {
+        let mut output = [0u8; 32];
+        unsafe {
+            randomx_calculate_hash_next(
+                self.vm.ptr,
+                next_input.as_ptr() as *const _,
+                next_input.len(),
+                output.as_mut_ptr() as *mut _,
+            );
+        }
+        output
+    }
+
+    /// Return the hash of the last input and close the batch
+    pub fn hash_last(self) -> [u8; 32] {
+        let mut output = [0u8; 32];
+        unsafe {
+            randomx_calculate_hash_last(self.vm.ptr, output.as_mut_ptr() as *mut _);
+        }
+        output
+    }
 }
 
 impl Drop for Vm {
@@ -319,6 +408,44 @@ mod tests {
         let hash3 = hasher.hash(b"Different input");
         assert_ne!(hash, hash3);
     }
+
+    #[test]
+    fn test_pipelined_hash_matches_single() {
+        let flags = Flags::recommended();
+        let mut cache = Cache::alloc(flags).unwrap();
+        cache.init(b"LUMENYX pipeline seed");
+        let mut vm = Vm::light(flags, &cache).unwrap();
+
+        let inputs: [&[u8]; 3] = [b"nonce-0", b"nonce-1", b"nonce-2"];
+        let expected: Vec<[u8; 32]> = inputs.iter().map(|i| vm.hash(i)).collect();
+
+        let mut batch = vm.hash_first(inputs[0]);
+        assert_eq!(batch.hash_next(inputs[1]), expected[0]);
+        assert_eq!(batch.hash_next(inputs[2]), expected[1]);
+        assert_eq!(batch.hash_last(), expected[2]);
+
+        // The VM is usable for single hashes again once the batch is closed
+        assert_eq!(vm.hash(inputs[0]), expected[0]);
+    }
+
+    #[test]
+    fn test_split_init_range_covers_all_items() {
+        for (count, threads) in [(10u64, 3usize), (9, 3), (2, 8), (1, 0), (0, 4), (34_078_719, 12)] {
+            let ranges = split_init_range(count, threads);
+            assert_eq!(ranges.len() as u64, (threads as u64).clamp(1, count.max(1)));
+
+            let mut next = 0u64;
+            for &(start, n) in &ranges {
+                assert_eq!(start, next);
+                next += n;
+            }
+            assert_eq!(next, count);
+
+            let min = ranges.iter().map(|r| r.1).min().unwrap();
+            let max = ranges.iter().map(|r| r.1).max().unwrap();
+            assert!(max - min <= 1);
+        }
+    }
 }
 
 #[cfg(test)]
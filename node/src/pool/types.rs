@@ -3,6 +3,10 @@
 use codec::{Decode, Encode};
 use sp_core::H256;
 
+/// Byte length of the preimage hashed by `PoolShare::compute_id`
+/// (prev + main_parent + miner + share_difficulty + nonce + timestamp_ms)
+const SHARE_ID_PREIMAGE_LEN: usize = 32 + 32 + 32 + 16 + 32 + 8;
+
 /// Account ID type for pool (raw 32 bytes)
 pub type PoolAccountId = [u8; 32];
 
@@ -28,7 +32,7 @@ pub struct PoolShare {
 impl PoolShare {
     /// Compute share ID from contents
     pub fn compute_id(&self) -> H256 {
-        let mut data = Vec::new();
+        let mut data = Vec::with_capacity(SHARE_ID_PREIMAGE_LEN);
         data.extend_from_slice(self.prev.as_ref());
         data.extend_from_slice(self.main_parent.as_ref());
         data.extend_from_slice(&self.miner);
@@ -157,14 +157,12 @@ impl<C> LumenyxPowBlockImport<C> {
         client: &C,
         header_without_seal: &<Block as BlockT>::Header,
         nonce: &[u8; 32],
+        difficulty: u128,
     ) -> bool
     where
-        C: HeaderBackend<Block> + StorageProvider<Block, FullBackend>,
+        C: HeaderBackend<Block>,
     {
         let height_u64: u64 = (*header_without_seal.number()).saturated_into::<u64>();
-        let parent_hash: H256 = *header_without_seal.parent_hash();
-
-        let difficulty = read_difficulty_from_storage(client, parent_hash);
         let target = difficulty_to_target(difficulty);
 
         let pre_hash = header_without_seal.hash();
@@ -187,13 +185,12 @@ impl<C> LumenyxPowBlockImport<C> {
         hash_meets_target(&pow_hash, &target)
     }
 
-    fn compute_total_difficulty(&self, client: &C, parent_hash: H256) -> U256
+    fn compute_total_difficulty(&self, client: &C, parent_hash: H256, difficulty: u128) -> U256
     where
-        C: AuxStore + StorageProvider<Block, FullBackend>,
+        C: AuxStore,
     {
         let parent_td = read_td(client, parent_hash);
-        let diff_u128 = read_difficulty_from_storage(client, parent_hash);
-        parent_td.saturating_add(U256::from(diff_u128))
+        parent_td.saturating_add(U256::from(difficulty))
     }
 
     fn should_be_best(&self, client: &C, new_hash: H256, new_td: U256) -> bool
@@ -251,14 +248,17 @@ where
         let pre_hash = params.header.hash();
         log::info!("pow_import: pre_hash={:?}", pre_hash);
 
+        // Difficulty at parent: read once, used by both PoW check and TD
+        let parent_hash = *params.header.parent_hash();
+        let difficulty = read_difficulty_from_storage(&*self.inner, parent_hash);
+
         // 3) Verify RX-LX PoW
-        if !self.verify_pow(&*self.inner, &params.header, &nonce) {
+        if !self.verify_pow(&*self.inner, &params.header, &nonce, difficulty) {
             return Ok(ImportResult::KnownBad);
         }
 
         // 4) TD + fork-choice (heaviest chain)
-        let parent_hash = *params.header.parent_hash();
-        let new_td = self.compute_total_difficulty(&*self.inner, parent_hash);
+        let new_td = self.compute_total_difficulty(&*self.inner, parent_hash, difficulty);
 
         let new_hash = compute_block_hash_like_client(&params.header, &params.post_digests);
         let is_best = self.should_be_best(&*self.inner, new_hash, new_td);
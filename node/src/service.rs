@@ -185,14 +185,16 @@ fn difficulty_storage_key() -> StorageKey {
     StorageKey(key)
 }
 
+/// Difficulty::CurrentDifficulty key, hashed once and reused for every read
+static DIFFICULTY_STORAGE_KEY: std::sync::LazyLock<StorageKey> =
+    std::sync::LazyLock::new(difficulty_storage_key);
+
 /// Read current difficulty from runtime storage
 fn read_difficulty_from_storage<C>(client: &C, at: H256) -> u128
 where
     C: StorageProvider<Block, FullBackend>,
 {
-    let key = difficulty_storage_key();
-
-    match client.storage(at, &key) {
+    match client.storage(at, &DIFFICULTY_STORAGE_KEY) {
         Ok(Some(data)) => match u128::decode(&mut &data.0[..]) {
             Ok(diff) => {
                 log::debug!("📊 Read difficulty from storage: {}", diff);
@@ -228,12 +230,10 @@ fn get_or_create_miner_key(base_path: &std::path::Path) -> sr25519::Pair {
 
     if key_file.exists() {
         if let Ok(seed_hex) = fs::read_to_string(&key_file) {
-            if let Ok(seed_bytes) = hex::decode(seed_hex.trim()) {
-                if seed_bytes.len() == 32 {
-                    let mut seed = [0u8; 32];
-                    seed.copy_from_slice(&seed_bytes);
-                    return sr25519::Pair::from_seed(&seed);
-                }
+            // Fails on anything but exactly 64 hex chars
+            let mut seed = [0u8; 32];
+            if hex::decode_to_slice(seed_hex.trim(), &mut seed).is_ok() {
+                return sr25519::Pair::from_seed(&seed);
             }
         }
     }
@@ -263,7 +263,6 @@ struct RxLxPow {
     cache: Cache,
     vm: Vm,
     seed_height: u64,
-    seed: H256,
 }
 
 impl RxLxPow {
@@ -292,7 +291,6 @@ impl RxLxPow {
             cache,
             vm,
             seed_height,
-            seed,
         })
     }
 
@@ -318,7 +316,6 @@ impl RxLxPow {
             .map_err(|e| format!("VM recreation failed: {:?}", e))?;
 
         self.seed_height = new_seed_height;
-        self.seed = new_seed;
         log::info!("✅ RX-LX reseeded successfully");
         Ok(())
     }
@@ -347,6 +344,29 @@ struct MiningJob {
     seed: H256,
 }
 
+/// Add one to a little-endian nonce, carrying across u64 limbs
+fn increment_nonce(nonce: &mut [u8]) {
+    for limb in nonce.chunks_exact_mut(8) {
+        let v = u64::from_le_bytes(<[u8; 8]>::try_from(&*limb).expect("chunks_exact yields 8 bytes"))
+            .wrapping_add(1);
+        limb.copy_from_slice(&v.to_le_bytes());
+        if v != 0 {
+            break;
+        }
+    }
+}
+
+/// Subtract one from a little-endian nonce, borrowing across u64 limbs
+fn decrement_nonce(nonce: &mut [u8]) {
+    for limb in nonce.chunks_exact_mut(8) {
+        let v = u64::from_le_bytes(<[u8; 8]>::try_from(&*limb).expect("chunks_exact yields 8 bytes"));
+        limb.copy_from_slice(&v.wrapping_sub(1).to_le_bytes());
+        if v != 0 {
+            break;
+        }
+    }
+}
+
 #[derive(Clone, Debug)]
 struct FoundNonce {
     job_id: u64,
@@ -436,13 +456,14 @@ impl MinerState {
                     let mut vm_opt: Option<rx_lx::Vm> = None;
                     let mut last_seed_height: u64 = u64::MAX;
 
-                    let mut local_nonce = [0u8; 32];
+                    // input = header_hash || nonce; the nonce half persists across jobs
+                    let mut input = [0u8; 64];
                     let seed_time = std::time::SystemTime::now()
                         .duration_since(std::time::UNIX_EPOCH)
                         .unwrap()
                         .as_nanos() as u64;
-                    local_nonce[0..8].copy_from_slice(&seed_time.to_le_bytes());
-                    local_nonce[8..16].copy_from_slice(&(thread_id as u64).to_le_bytes());
+                    input[32..40].copy_from_slice(&seed_time.to_le_bytes());
+                    input[40..48].copy_from_slice(&(thread_id as u64).to_le_bytes());
                     let mut last_processed_job_id: u64 = 0;
                     loop {
                         // Poll for new job
@@ -463,7 +484,10 @@ impl MinerState {
 
                                 match rx_lx::Dataset::alloc(flags) {
                                     Ok(mut ds) => {
-                                        ds.init(&cache);
+                                        // Other workers are still filling their own light caches
+                                        // (cache.init above) before they reach the ready-wait, so
+                                        // this overlaps with them on the same cores at first.
+                                        ds.init_parallel(&cache, num_threads);
                                         // Create VM from dataset pointer BEFORE moving ds into Arc
                                         let vm_result = rx_lx::Vm::fast(flags, &ds);
                                         {
@@ -528,57 +552,69 @@ impl MinerState {
                             last_seed_height = job.seed_height;
                         }
 
-                        let Some(vm) = vm_opt.as_ref() else {
+                        let Some(vm) = vm_opt.as_mut() else {
                             continue;
                         };
 
+                        // header half is fixed for the job
+                        input[..32].copy_from_slice(job.pre_hash.as_ref());
+
+                        // Prime the RandomX pipeline: each hash_next returns the hash of
+                        // the previous nonce while the VM starts on the current one.
+                        increment_nonce(&mut input[32..]);
+                        let mut batch = vm.hash_first(&input);
+
+                        let target = job.target;
+                        let share_target = job.share_target;
+
                         'mine_job: loop {
                             let cur = *job_rx.borrow(); if cur.job_id != job.job_id { let _ = job_rx.borrow_and_update(); break 'mine_job; }
 
-                            let pre_hash = job.pre_hash;
-                            let target = job.target;
-                            let share_target = job.share_target;
+                            let mut chunk_hashes: u64 = 0;
+                            let mut block_found = false;
 
                             for _ in 0..CHUNK_ITERS {
-                                // increment nonce
-                                for i in 0..32 {
-                                    if local_nonce[i] == 255 {
-                                        local_nonce[i] = 0;
-                                    } else {
-                                        local_nonce[i] += 1;
-                                        break;
-                                    }
-                                }
+                                increment_nonce(&mut input[32..]);
+                                let pow_hash = sp_core::H256::from_slice(&batch.hash_next(&input));
+                                chunk_hashes += 1;
 
-                                // input = header_hash || nonce
-                                let mut input = [0u8; 64];
-                                input[..32].copy_from_slice(pre_hash.as_ref());
-                                input[32..].copy_from_slice(&local_nonce);
+                                // Fast reject: target <= share_target, so a hash above
+                                // the share target can never meet the block target.
+                                if pow_hash > share_target {
+                                    continue;
+                                }
 
-                                let pow_hash = sp_core::H256::from_slice(&vm.hash(&input));
+                                // pow_hash belongs to the nonce before the one in flight
+                                let mut nonce = [0u8; 32];
+                                nonce.copy_from_slice(&input[32..]);
+                                decrement_nonce(&mut nonce);
 
-                                // hash counters
-                                per_thread_hashes[thread_id].fetch_add(1, Ordering::Relaxed);
-                                total_hashes.fetch_add(1, Ordering::Relaxed);
+                                // Share found (easier target)
+                                let _ = found_share_tx.send(FoundShare {
+                                    job_id: job.job_id,
+                                    height: job.height,
+                                    parent_hash: job.parent_hash,
+                                    nonce,
+                                });
 
-                                // Check for share first (easier target)
-                                if pow_hash <= share_target {
-                                    let _ = found_share_tx.send(FoundShare {
-                                        job_id: job.job_id,
-                                        height: job.height,
-                                        parent_hash: job.parent_hash,
-                                        nonce: local_nonce,
-                                    });
-                                }
                                 // Check for block (harder target)
                                 if pow_hash <= target {
                                     let _ = found_tx.send(FoundNonce {
                                         job_id: job.job_id,
-                                        nonce: local_nonce,
+                                        nonce,
                                     });
-                                    break 'mine_job;
+                                    block_found = true;
+                                    break;
                                 }
                             }
+
+                            // hash counters (shared atomics, flushed once per chunk)
+                            per_thread_hashes[thread_id].fetch_add(chunk_hashes, Ordering::Relaxed);
+                            total_hashes.fetch_add(chunk_hashes, Ordering::Relaxed);
+
+                            if block_found {
+                                break 'mine_job;
+                            }
                         }
                     }
                 })
@@ -639,6 +675,22 @@ pub(crate) struct PowTemplate {
     pub seed: H256,
 }
 
+impl PowTemplate {
+    /// Worker-facing job for this template
+    fn job(&self) -> MiningJob {
+        MiningJob {
+            job_id: self.job_id,
+            height: self.height,
+            parent_hash: self.parent_hash,
+            pre_hash: self.pre_hash,
+            target: self.target,
+            share_target: self.share_target,
+            seed_height: self.seed_height,
+            seed: self.seed,
+        }
+    }
+}
+
 // LRU max 2 templates (active + previous)
 pub(crate) struct TemplateLru2 {
     order: std::collections::VecDeque<u64>,
@@ -709,7 +761,8 @@ fn compute_pow_hash_blake3(data: &[u8], nonce: &[u8; 32]) -> H256 {
 
 const MIN_DIFFICULTY: u128 = 1;
 const MAX_DIFFICULTY: u128 = u128::MAX;
-const POW_LIMIT: H256 = H256::repeat_byte(0xff);
+/// Easiest possible target (all bits set), kept as U256 for the division below
+const POW_LIMIT: U256 = U256::MAX;
 
 fn difficulty_to_target(difficulty: u128) -> H256 {
     let mut d = difficulty;
@@ -723,26 +776,27 @@ fn difficulty_to_target(difficulty: u128) -> H256 {
         d = MIN_DIFFICULTY;
     }
 
-    let pow_u = U256::from_big_endian(POW_LIMIT.as_fixed_bytes());
-
-    let mut d_be = [0u8; 32];
-    d_be[16..].copy_from_slice(&d.to_be_bytes());
-    let d_u = U256::from_big_endian(&d_be);
-
-    let mut target_u = pow_u / d_u;
+    let mut target_u = POW_LIMIT / U256::from(d);
 
     if target_u == U256::from(0u64) {
         target_u = U256::from(1u64);
     }
-    if target_u > pow_u {
-        target_u = pow_u;
-    }
 
     let mut target_be = [0u8; 32];
     target_u.to_big_endian(&mut target_be);
     H256::from_slice(&target_be)
 }
 
+/// Pool share difficulty for a main-chain difficulty (never below 1)
+fn share_difficulty(difficulty: u128) -> u128 {
+    (difficulty / SHARE_DIFFICULTY_DIVISOR).max(1)
+}
+
+/// Block target and (easier) pool share target for a main-chain difficulty
+fn mining_targets(difficulty: u128) -> (H256, H256) {
+    (difficulty_to_target(difficulty), difficulty_to_target(share_difficulty(difficulty)))
+}
+
 fn hash_meets_target(hash: &H256, target: &H256) -> bool {
     hash <= target
 }
@@ -1159,15 +1213,8 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                     }
                 };
 
-                let mut rx_lx_pow = match RxLxPow::new(0, &get_block_hash) {
-                    Ok(pow) => pow,
-                    Err(e) => {
-                        log::error!("❌ Failed to initialize RX-LX: {}", e);
-                        return;
-                    }
-                };
-                log::info!("⛏️  RX-LX PoW engine initialized!");
-
+                // The task only needs the seed for each job; workers build their own
+                // RX-LX cache/dataset from it, and import verifies with its own VM.
                 let mut miner_state = MinerState::new(num_threads);
                 let sharechain = std::sync::Arc::new(std::sync::Mutex::new(Sharechain::new()));
 
@@ -1202,16 +1249,10 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                     let height: u64 = (parent_number as u64) + 1;
 
                     let difficulty: u128 = read_difficulty_from_storage(&*mining_client, parent_hash);
-                    let target: H256 = difficulty_to_target(difficulty);
-                    let share_difficulty = (difficulty / SHARE_DIFFICULTY_DIVISOR).max(1);
-                    let share_target: H256 = difficulty_to_target(share_difficulty);
+                    let (target, share_target) = mining_targets(difficulty);
 
                     let seed_height_val: u64 = seed_sched::seed_height(height);
-                    if let Err(e) = rx_lx_pow.maybe_reseed(height, &get_block_hash) {
-                        log::error!("❌ RX-LX reseed failed: {}", e);
-                        return;
-                    }
-                    let seed: H256 = rx_lx_pow.seed;
+                    let seed: H256 = seed_sched::get_seed(height, &get_block_hash);
 
                     use sp_inherents::InherentDataProvider;
                     let timestamp = sp_timestamp::InherentDataProvider::from_system_time();
@@ -1248,10 +1289,10 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                     let pool_payout_digest_item =
                         prepare_pool_payout_digest_item(&pool_mode_handle, parent_number, &sharechain);
 
-                    let mut header_no_seal = header.clone();
+                    let mut header_no_seal = header;
 
 
-                    if let Some(di) = pool_payout_digest_item.clone() {
+                    if let Some(di) = pool_payout_digest_item {
                         header_no_seal.digest_mut().logs.push(di);
                     }
                     header_no_seal.digest_mut().logs.retain(|d| {
@@ -1274,16 +1315,7 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                         seed,
                     };
 
-                    let job = MiningJob {
-                        job_id: tpl.job_id,
-                        height: tpl.height,
-                        parent_hash: tpl.parent_hash,
-                        pre_hash: tpl.pre_hash,
-                        target: tpl.target,
-                        share_target: tpl.share_target,
-                        seed_height: tpl.seed_height,
-                        seed: tpl.seed,
-                    };
+                    let job = tpl.job();
 
                     templates.insert(tpl);
                     match miner_state.job_tx.send(job) { Ok(()) => log::info!("📤 Sent job_id={} (bootstrap)", job.job_id), Err(e) => log::error!("❌ job_tx.send failed (bootstrap): {:?}", e), }
@@ -1324,16 +1356,10 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                             let height: u64 = (parent_number as u64) + 1;
 
                             let difficulty: u128 = read_difficulty_from_storage(&*mining_client, parent_hash);
-                            let target: H256 = difficulty_to_target(difficulty);
-                            let share_difficulty = (difficulty / SHARE_DIFFICULTY_DIVISOR).max(1);
-                            let share_target: H256 = difficulty_to_target(share_difficulty);
+                            let (target, share_target) = mining_targets(difficulty);
 
                             let seed_height_val: u64 = seed_sched::seed_height(height);
-                            if let Err(e) = rx_lx_pow.maybe_reseed(height, &get_block_hash) {
-                                log::error!("❌ RX-LX reseed failed: {}", e);
-                                continue;
-                            }
-                            let seed: H256 = rx_lx_pow.seed;
+                            let seed: H256 = seed_sched::get_seed(height, &get_block_hash);
 
                             use sp_inherents::InherentDataProvider;
                             let timestamp = sp_timestamp::InherentDataProvider::from_system_time();
@@ -1370,10 +1396,10 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                     let pool_payout_digest_item =
                         prepare_pool_payout_digest_item(&pool_mode_handle, parent_number, &sharechain);
 
-                            let mut header_no_seal = header.clone();
+                            let mut header_no_seal = header;
 
 
-                    if let Some(di) = pool_payout_digest_item.clone() {
+                    if let Some(di) = pool_payout_digest_item {
                         header_no_seal.digest_mut().logs.push(di);
                     }
                             header_no_seal.digest_mut().logs.retain(|d| {
@@ -1396,16 +1422,7 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                                 seed,
                             };
 
-                            let job = MiningJob {
-                                job_id: tpl.job_id,
-                                height: tpl.height,
-                                parent_hash: tpl.parent_hash,
-                                pre_hash: tpl.pre_hash,
-                                target: tpl.target,
-                                share_target: tpl.share_target,
-                                seed_height: tpl.seed_height,
-                                seed: tpl.seed,
-                            };
+                            let job = tpl.job();
 
                             templates.insert(tpl);
                             match miner_state.job_tx.send(job) { Ok(()) => log::info!("📤 Sent job_id={} (new best)", job.job_id), Err(e) => log::error!("❌ job_tx.send failed (new best): {:?}", e), }
@@ -1432,7 +1449,7 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
 
                             // 1 DB read per tick: difficulty (riusata per tutte le share accettate in questo tick)
                             let difficulty_now: u128 = read_difficulty_from_storage(&*mining_client, best_hash_now);
-                            let share_difficulty: u128 = (difficulty_now / SHARE_DIFFICULTY_DIVISOR).max(1);
+                            let share_difficulty: u128 = share_difficulty(difficulty_now);
 
                             // 1) Receive shares from peers (bounded)
                             if let Some(ref mut gossip) = pool_gossip.as_mut() {
@@ -1519,31 +1536,29 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                                 continue;
                             };
 
-                            let pow_hash = rx_lx_pow.hash(&tpl.pre_hash, &found.nonce);
-                            if pow_hash > tpl.target {
-                                log::warn!(
-                                    "nonce invalid locally job_id={} height={} pow_hash={:?} target={:?}",
-                                    tpl.job_id, tpl.height, pow_hash, tpl.target
-                                );
-                                continue;
-                            }
-
+                            // No local re-hash here: LumenyxPowBlockImport::verify_pow checks the
+                            // seal against the target on import and rejects it as KnownBad.
                             log::info!(
-                                "🎯 Nonce found job_id={} height={} parent={:?} pre_hash={:?} pow_hash={:?}",
-                                tpl.job_id, tpl.height, tpl.parent_hash, tpl.pre_hash, pow_hash
+                                "🎯 Nonce found job_id={} height={} parent={:?} pre_hash={:?}",
+                                tpl.job_id, tpl.height, tpl.parent_hash, tpl.pre_hash
                             );
 
-                            let mut import_params = BlockImportParams::new(BlockOrigin::Own, tpl.header_no_seal.clone());
+                            let mut import_params = BlockImportParams::new(BlockOrigin::Own, tpl.header_no_seal);
                             let seal = DigestItem::Seal(LUMENYX_ENGINE_ID, found.nonce.to_vec());
                             import_params.post_digests.push(seal);
 
-                            import_params.body = Some(tpl.body.clone());
+                            import_params.body = Some(tpl.body);
                             import_params.state_action = sc_consensus::StateAction::ApplyChanges(
                                 sc_consensus::StorageChanges::Changes(tpl.storage_changes),
                             );
 
                             match block_import.import_block(import_params).await {
-                                Ok(r) => log::info!("✅ mined import_result={:?} job_id={} height={} pre_hash={:?}", r, tpl.job_id, tpl.height, tpl.pre_hash),
+                                Ok(r @ sc_consensus::ImportResult::Imported(_)) => log::info!("✅ mined import_result={:?} job_id={} height={} pre_hash={:?}", r, tpl.job_id, tpl.height, tpl.pre_hash),
+                                // KnownBad here means our own seal failed PoW verification on import
+                                Ok(r) => log::warn!(
+                                    "⚠️ mined block not imported import_result={:?} job_id={} height={} pre_hash={:?} nonce=0x{}",
+                                    r, tpl.job_id, tpl.height, tpl.pre_hash, hex::encode(found.nonce)
+                                ),
                                 Err(e) => log::error!("❌ Failed to import mined block job_id={} height={} err={:?}", tpl.job_id, tpl.height, e),
                             }
 
@@ -1559,16 +1574,10 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                                             let height: u64 = (parent_number as u64) + 1;
 
                                             let difficulty: u128 = read_difficulty_from_storage(&*mining_client, parent_hash);
-                                            let target: H256 = difficulty_to_target(difficulty);
-                                            let share_difficulty = (difficulty / SHARE_DIFFICULTY_DIVISOR).max(1);
-                                            let share_target: H256 = difficulty_to_target(share_difficulty);
+                                            let (target, share_target) = mining_targets(difficulty);
 
                                             let seed_height_val: u64 = seed_sched::seed_height(height);
-                                            if let Err(e) = rx_lx_pow.maybe_reseed(height, &get_block_hash) {
-                                                log::error!("❌ RX-LX reseed failed on re-arm: {}", e);
-                                                continue;
-                                            }
-                                            let seed: H256 = rx_lx_pow.seed;
+                                            let seed: H256 = seed_sched::get_seed(height, &get_block_hash);
 
                                             use sp_inherents::InherentDataProvider;
                                             let timestamp = sp_timestamp::InherentDataProvider::from_system_time();
@@ -1605,10 +1614,10 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                     let pool_payout_digest_item =
                         prepare_pool_payout_digest_item(&pool_mode_handle, parent_number, &sharechain);
 
-                                            let mut header_no_seal = header.clone();
+                                            let mut header_no_seal = header;
 
 
-                    if let Some(di) = pool_payout_digest_item.clone() {
+                    if let Some(di) = pool_payout_digest_item {
                         header_no_seal.digest_mut().logs.push(di);
                     }
                                             header_no_seal.digest_mut().logs.retain(|d| {
@@ -1631,16 +1640,7 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
                                                 seed,
                                             };
 
-                                            let job = MiningJob {
-                                                job_id: tpl.job_id,
-                                                height: tpl.height,
-                                                parent_hash: tpl.parent_hash,
-                                                pre_hash: tpl.pre_hash,
-                                                target: tpl.target,
-                                                share_target: tpl.share_target,
-                                                seed_height: tpl.seed_height,
-                                                seed: tpl.seed,
-                                            };
+                                            let job = tpl.job();
 
                                             templates.insert(tpl);
                                             match miner_state.job_tx.send(job) { Ok(()) => log::info!("📤 Sent job_id={} (re-arm)", job.job_id), Err(e) => log::error!("❌ job_tx.send failed (re-arm): {:?}", e), }
@@ -1670,3 +1670,82 @@ pub fn new_full(config: Configuration, pool_mode: bool) -> Result<TaskManager, S
     network_starter.start_network();
     Ok(task_manager)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// The byte-wise loop increment_nonce replaced
+    fn byte_increment(nonce: &mut [u8]) {
+        for b in nonce.iter_mut() {
+            if *b == 255 {
+                *b = 0;
+            } else {
+                *b += 1;
+                break;
+            }
+        }
+    }
+
+    fn nonce_with_limbs(limbs: [u64; 4]) -> [u8; 32] {
+        let mut n = [0u8; 32];
+        for (chunk, limb) in n.chunks_exact_mut(8).zip(limbs) {
+            chunk.copy_from_slice(&limb.to_le_bytes());
+        }
+        n
+    }
+
+    #[test]
+    fn test_nonce_round_trip() {
+        for seed in [
+            [0u8; 32],
+            [255u8; 32],
+            nonce_with_limbs([u64::MAX, 7, 0, 0]),
+            nonce_with_limbs([0, 0, 1, u64::MAX]),
+            nonce_with_limbs([0x0123_4567_89ab_cdef, 42, u64::MAX, 3]),
+        ] {
+            let mut n = seed;
+            increment_nonce(&mut n);
+            decrement_nonce(&mut n);
+            assert_eq!(n, seed);
+
+            decrement_nonce(&mut n);
+            increment_nonce(&mut n);
+            assert_eq!(n, seed);
+        }
+    }
+
+    #[test]
+    fn test_increment_nonce_carries_into_next_limb() {
+        let mut n = nonce_with_limbs([u64::MAX, 5, 9, 9]);
+        increment_nonce(&mut n);
+        assert_eq!(n, nonce_with_limbs([0, 6, 9, 9]));
+    }
+
+    #[test]
+    fn test_decrement_nonce_borrows_from_next_limb() {
+        let mut n = nonce_with_limbs([0, 6, 9, 9]);
+        decrement_nonce(&mut n);
+        assert_eq!(n, nonce_with_limbs([u64::MAX, 5, 9, 9]));
+    }
+
+    #[test]
+    fn test_increment_nonce_matches_byte_loop() {
+        for seed in [
+            [0u8; 32],
+            [255u8; 32],
+            nonce_with_limbs([u64::MAX - 2, 0, 0, 0]),
+            nonce_with_limbs([u64::MAX - 2, u64::MAX, 0, 0]),
+            nonce_with_limbs([0xff, 0, 0, 0]),
+            nonce_with_limbs([0x00ff_ffff_ffff_fffe, 1, 2, 3]),
+        ] {
+            let mut limb_wise = seed;
+            let mut byte_wise = seed;
+            for _ in 0..600 {
+                increment_nonce(&mut limb_wise);
+                byte_increment(&mut byte_wise);
+                assert_eq!(limb_wise, byte_wise);
+            }
+        }
+    }
+}